@@ -2,30 +2,37 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
-# Set random seed for reproducibility (Her seferinde aynı veriyi üretsin)
-np.random.seed(42)
+# Seeded generator for reproducibility (Her seferinde aynı veriyi üretsin)
+rng = np.random.default_rng(42)
 
 # Number of records
 n_records = 1000
 
+
+def pick(values, size):
+    """Draw `size` values by fancy-indexing a prebuilt object array with random indices"""
+    values = np.array(values, dtype=object)
+    return values[rng.integers(0, values.size, size)]
+
+
 # Generate sample e-commerce data with INTENTIONAL PROBLEMS
 data = {
     'order_id': range(1001, 1001 + n_records),
     
     # Customer names - some with extra spaces, mixed case
-    'customer_name': np.random.choice([
+    'customer_name': pick([
         'John Doe', 'jane smith', 'ALICE WONG', '  Bob Johnson  ', 
         'Maria Garcia', None, 'Emma Wilson', 'Michael Brown  '
     ], n_records),
     
     # Email - some invalid, some null
-    'email': np.random.choice([
+    'email': pick([
         'john@email.com', 'jane@email.com', 'alice@invalid', 
         None, 'bob@email.com', 'not-an-email', 'maria@email.com'
     ], n_records),
     
     # Product category - inconsistent naming
-    'category': np.random.choice([
+    'category': pick([
         'Electronics', 'electronics', 'ELECTRONICS',
         'Clothing', 'clothing', 'Books', 'books',
         None, 'Home & Garden', 'home & garden'
@@ -33,56 +40,54 @@ data = {
     
     # Price - some negative (error), some outliers, some null
     'price': np.concatenate([
-        np.random.uniform(10, 500, 950),  # Normal prices
-        np.random.uniform(-50, -10, 20),  # Negative prices (error)
-        [None] * 20,                       # Null values
-        np.random.uniform(5000, 10000, 10) # Outliers
+        rng.uniform(10, 500, 950),        # Normal prices
+        rng.uniform(-50, -10, 20),        # Negative prices (error)
+        np.full(20, np.nan),              # Null values
+        rng.uniform(5000, 10000, 10)      # Outliers
     ]),
     
     # Quantity - some zero, some negative, some null
-    'quantity': np.concatenate([
-        np.random.randint(1, 10, 950),
-        np.random.randint(-5, 0, 20),  # Negative quantities
-        [None] * 20,
-        np.random.randint(0, 1, 10)    # Zero quantities
-    ]),
+    'quantity': pd.array(np.concatenate([
+        rng.integers(1, 10, 950),
+        rng.integers(-5, 0, 20),       # Negative quantities
+        np.full(20, np.nan),
+        rng.integers(0, 1, 10)         # Zero quantities
+    ]), dtype='Int64'),
     
     # Order date - some invalid formats, some future dates
-    'order_date': np.random.choice([
+    'order_date': pick([
         '2024-01-15', '2024/02/20', '15-03-2024',  # Different formats
         None, '2026-12-31',  # Future date
         '2024-01-01', '2024-02-14', '2023-11-20'
     ], n_records),
     
     # Payment status - inconsistent values
-    'payment_status': np.random.choice([
+    'payment_status': pick([
         'Paid', 'paid', 'PAID', 'Pending', 'pending',
         'Failed', 'failed', None, 'Refunded', 'Unknown'
     ], n_records),
     
     # Customer rating - some out of range (1-5 expected)
-    'customer_rating': np.concatenate([
-        np.random.randint(1, 6, 950),  # Valid ratings 1-5
-        np.random.randint(6, 11, 20),  # Invalid ratings
-        [None] * 30
-    ])
+    'customer_rating': pd.array(np.concatenate([
+        rng.integers(1, 6, 950),       # Valid ratings 1-5
+        rng.integers(6, 11, 20),       # Invalid ratings
+        np.full(30, np.nan)
+    ]), dtype='Int64')
 }
 
-# Create DataFrame
-df = pd.DataFrame(data)
-
-# Shuffle the data
-df = df.sample(frac=1, random_state=42).reset_index(drop=True)
+# Shuffle the rows and add some duplicate rows (realistic problem) in one take:
+# row order = shuffled rows followed by 50 of them repeated
+shuffled = rng.permutation(n_records)
+duplicates = shuffled[rng.choice(n_records, 50, replace=False)]
 
-# Add some duplicate rows (realistic problem)
-duplicates = df.sample(50, random_state=42)
-df = pd.concat([df, duplicates], ignore_index=True)
+df = pd.DataFrame(data).iloc[np.concatenate([shuffled, duplicates])].reset_index(drop=True)
 
-# Save to CSV
+# Save to CSV (human readable) and Parquet (typed, zstd-compressed)
 df.to_csv('data/raw/ecommerce_raw_data.csv', index=False)
+df.to_parquet('data/raw/ecommerce_raw_data.parquet', engine='pyarrow', compression='zstd', index=False)
 
 print(f"✅ Generated {len(df)} records with intentional data quality issues")
-print(f"📁 Saved to: data/raw/ecommerce_raw_data.csv")
+print(f"📁 Saved to: data/raw/ecommerce_raw_data.csv (+ .parquet)")
 print("\n📊 Problems included:")
 print("- Missing values (nulls)")
 print("- Inconsistent formatting (spaces, case)")
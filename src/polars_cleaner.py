@@ -0,0 +1,345 @@
+"""
+E-Commerce Data Cleaning Pipeline (Polars lazy engine)
+Description: Same cleaning rules as data_cleaner.py, expressed as a single
+Polars LazyFrame plan so the whole pipeline runs in one optimized pass.
+
+Functions:
+1. clean_column_names() - Standardize column names
+2. handle_missing_values() - Handle null values
+3. normalize_text_columns() - Normalize text data
+4. remove_invalid_data() - Remove invalid records
+5. remove_duplicates() - Remove duplicate rows
+
+Every function takes and returns a LazyFrame; nothing is read or computed
+until clean_data_pipeline() collects the plan at the very end.
+clean_data_pipeline_streaming() instead sinks the plan straight to disk,
+so inputs larger than memory can be cleaned.
+"""
+
+import logging
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+# Date formats found in the raw order_date column (dash format is day-first);
+# keep in sync with data_cleaner.DATE_FORMATS
+DATE_FORMATS = ['%Y-%m-%d', '%Y/%m/%d', '%d-%m-%Y']
+
+
+# ============================================================================
+# FUNCTION 1: CLEAN COLUMN NAMES
+# ============================================================================
+
+def clean_column_names(lf):
+    """Clean column names: lowercase, replace spaces with underscores"""
+    logger.info("\n🔧 Cleaning column names...")
+
+    lf = lf.rename({col: col.lower().replace(' ', '_') for col in lf.columns})
+
+    logger.info("✅ Column names cleaned\n")
+
+    return lf
+
+
+# ============================================================================
+# FUNCTION 2: HANDLE MISSING VALUES
+# ============================================================================
+
+def compute_fill_values(lf):
+    """
+    Compute the median/mode fill values in one small aggregation pass
+
+    Passing these to handle_missing_values() as literals keeps the main plan
+    free of whole-column aggregations, which the streaming engine can't sink.
+
+    Parameters:
+        lf (LazyFrame): Lazy frame with cleaned column names
+
+    Returns:
+        dict: Fill value per column
+    """
+    columns = lf.columns
+    aggregations = [
+        pl.col(col).median()
+        for col in ['price', 'quantity', 'customer_rating'] if col in columns
+    ]
+    if 'category' in columns:
+        aggregations.append(pl.col('category').drop_nulls().mode().sort().first())
+
+    if not aggregations:
+        return {}
+    return lf.select(aggregations).collect(streaming=True).row(0, named=True)
+
+
+def handle_missing_values(lf, fill_values=None):
+    """
+    Handle missing values based on column type
+
+    Parameters:
+        lf (LazyFrame): Input lazy frame
+        fill_values (dict): Precomputed median/mode values (see
+            compute_fill_values); computed inside the plan if omitted
+
+    Returns:
+        LazyFrame: Lazy frame with nulls handled
+    """
+    logger.info("\n🔍 Handling missing values...")
+
+    columns = lf.columns
+    fills = []
+
+    # Numerical columns - fill with median
+    for col in ['price', 'quantity', 'customer_rating']:
+        if col in columns:
+            median_value = fill_values[col] if fill_values else pl.col(col).median()
+            fills.append(pl.col(col).fill_null(median_value))
+            logger.info(f"   ✓ {col}: Fill nulls with median")
+
+    # Category - fill with mode (smallest value wins ties, like pandas)
+    if 'category' in columns:
+        if fill_values:
+            mode_value = pl.lit(fill_values['category'])
+        else:
+            mode_value = pl.col('category').drop_nulls().mode().sort().first()
+        fills.append(pl.col('category').fill_null(mode_value))
+        logger.info("   ✓ category: Fill nulls with mode")
+
+    # Customer name - fill with 'Unknown Customer'
+    if 'customer_name' in columns:
+        fills.append(pl.col('customer_name').fill_null('Unknown Customer'))
+        logger.info("   ✓ customer_name: Fill nulls with 'Unknown Customer'")
+
+    # Payment status - fill with 'Unknown'
+    if 'payment_status' in columns:
+        fills.append(pl.col('payment_status').fill_null('Unknown'))
+        logger.info("   ✓ payment_status: Fill nulls with 'Unknown'")
+
+    if fills:
+        lf = lf.with_columns(fills)
+
+    # Email / order date - drop rows (critical fields)
+    critical_cols = [col for col in ['email', 'order_date'] if col in columns]
+    if critical_cols:
+        lf = lf.drop_nulls(subset=critical_cols)
+        logger.info(f"   ✓ {', '.join(critical_cols)}: Drop null rows (critical)")
+
+    # Order date - parse the known formats, drop rows that match none
+    if 'order_date' in columns:
+        lf = lf.with_columns(
+            pl.coalesce([
+                pl.col('order_date').str.strptime(pl.Date, fmt, strict=False)
+                for fmt in DATE_FORMATS
+            ])
+        ).drop_nulls(subset=['order_date'])
+        logger.info("   ✓ order_date: Parsed to date, dropped unparseable rows")
+
+    logger.info("✅ Missing values handled\n")
+
+    return lf
+
+
+# ============================================================================
+# FUNCTION 3: NORMALIZE TEXT DATA
+# ============================================================================
+
+def normalize_text_columns(lf):
+    """Normalize text data: remove extra spaces, standardize case"""
+    logger.info("\n🔤 Normalizing text columns...")
+
+    columns = lf.columns
+    exprs = []
+
+    # Customer name - Title case
+    if 'customer_name' in columns:
+        exprs.append(pl.col('customer_name').str.strip_chars().str.to_titlecase())
+        logger.info("   ✓ customer_name: Stripped spaces + Title case")
+
+    # Email, category, payment status - lowercase
+    for col in ['email', 'category', 'payment_status']:
+        if col in columns:
+            exprs.append(pl.col(col).str.strip_chars().str.to_lowercase())
+            logger.info(f"   ✓ {col}: Stripped spaces + Lowercase")
+
+    if exprs:
+        lf = lf.with_columns(exprs)
+
+    logger.info("✅ Text normalization complete\n")
+    return lf
+
+
+# ============================================================================
+# FUNCTION 4: REMOVE INVALID DATA
+# ============================================================================
+
+def remove_invalid_data(lf):
+    """
+    Remove invalid data
+
+    Rules:
+    - Price must be > 0
+    - Quantity must be > 0
+    - Rating must be 1-5
+    - Email must contain '@'
+    """
+    logger.info("\n❌ Removing invalid data...")
+
+    columns = lf.columns
+    rules = []
+
+    if 'price' in columns:
+        rules.append(pl.col('price') > 0)
+    if 'quantity' in columns:
+        rules.append(pl.col('quantity') > 0)
+    if 'customer_rating' in columns:
+        rules.append(pl.col('customer_rating').is_between(1, 5))
+    if 'email' in columns:
+        rules.append(pl.col('email').str.contains('@', literal=True))
+
+    # One combined predicate so the optimizer can push it down as a single filter
+    if rules:
+        lf = lf.filter(pl.all_horizontal(rules))
+        logger.info(f"   ✓ Filtering on {len(rules)} rules")
+
+    logger.info("✅ Invalid data removed\n")
+    return lf
+
+
+# ============================================================================
+# FUNCTION 5: REMOVE DUPLICATES
+# ============================================================================
+
+def remove_duplicates(lf, key='order_id', maintain_order=True):
+    """
+    Remove duplicate rows (keep first occurrence)
+
+    Rows count as duplicates when they share the same `key` value; without
+    the key column whole rows are compared.
+
+    Parameters:
+        lf (LazyFrame): Input lazy frame
+        key (str): Primary-key column used to detect duplicates
+        maintain_order (bool): Keep input row order (not streamable)
+
+    Returns:
+        LazyFrame: Lazy frame without duplicates
+    """
+    logger.info("\n🔄 Removing duplicate rows...")
+
+    subset = [key] if key in lf.columns else None
+    lf = lf.unique(subset=subset, keep='first', maintain_order=maintain_order)
+
+    logger.info("✅ Duplicates removed\n")
+    return lf
+
+
+# ============================================================================
+# MAIN PIPELINE: Clean the data
+# ============================================================================
+
+def build_pipeline(input_path, streaming=False):
+    """
+    Build the lazy cleaning plan without executing it
+
+    Parameters:
+        input_path (str): Path to raw CSV file
+        streaming (bool): Make every node streamable: fill values are
+            computed up front and row order is not preserved
+
+    Returns:
+        LazyFrame: Unexecuted cleaning plan
+    """
+    lf = pl.scan_csv(input_path)
+
+    lf = clean_column_names(lf)
+    fill_values = compute_fill_values(lf) if streaming else None
+    lf = handle_missing_values(lf, fill_values)
+    lf = normalize_text_columns(lf)
+    lf = remove_invalid_data(lf)
+    lf = remove_duplicates(lf, maintain_order=not streaming)
+
+    return lf
+
+
+def clean_data_pipeline(input_path, output_path):
+    """
+    Complete data cleaning pipeline (single collect at the end)
+
+    Parameters:
+        input_path (str): Path to raw CSV file
+        output_path (str): Path to save cleaned CSV file
+
+    Returns:
+        DataFrame: Cleaned polars dataframe
+    """
+    logger.info("\n" + "=" * 70)
+    logger.info("🚀 STARTING DATA CLEANING PIPELINE (POLARS LAZY)")
+    logger.info("=" * 70)
+
+    logger.info(f"\n📂 Scanning data from: {input_path}")
+    lf = build_pipeline(input_path)
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n🧭 Query plan:")
+        logger.info(lf.explain(streaming=True, comm_subplan_elim=False))
+
+    # The only point where data is actually read and processed
+    df = lf.collect(streaming=True)
+
+    df.write_csv(output_path)
+    logger.info(f"\n💾 Cleaned data saved to: {output_path}")
+    logger.info(f"   Final shape: {df.shape[0]} rows, {df.shape[1]} columns")
+
+    logger.info("\n" + "=" * 70)
+    logger.info("✅ PIPELINE COMPLETE!")
+    logger.info("=" * 70)
+
+    return df
+
+
+def clean_data_pipeline_streaming(input_path, output_path):
+    """
+    Streaming data cleaning pipeline for inputs larger than memory
+
+    The input is read twice: once for the median/mode fill values, then
+    once through the streaming engine, which processes it in batches and
+    writes straight to disk. Output rows are not in input order.
+
+    Parameters:
+        input_path (str): Path to raw CSV file
+        output_path (str): Path to save cleaned CSV or Parquet file
+    """
+    logger.info("\n" + "=" * 70)
+    logger.info("🚀 STARTING DATA CLEANING PIPELINE (POLARS STREAMING)")
+    logger.info("=" * 70)
+
+    logger.info(f"\n📂 Scanning data from: {input_path}")
+    lf = build_pipeline(input_path, streaming=True)
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n🧭 Query plan:")
+        logger.info(lf.explain(streaming=True, comm_subplan_elim=False))
+
+    if output_path.endswith('.parquet'):
+        lf.sink_parquet(output_path, compression='zstd')
+    else:
+        lf.sink_csv(output_path)
+    logger.info(f"\n💾 Cleaned data streamed to: {output_path}")
+
+    logger.info("\n" + "=" * 70)
+    logger.info("✅ PIPELINE COMPLETE!")
+    logger.info("=" * 70)
+
+
+# ============================================================================
+# MAIN: RUN THE LAZY PIPELINE
+# ============================================================================
+
+if __name__ == "__main__":
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    clean_data_pipeline(
+        'data/raw/ecommerce_raw_data.csv',
+        'data/cleaned/ecommerce_cleaned_data.csv'
+    )